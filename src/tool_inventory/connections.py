@@ -15,31 +15,39 @@ __all__: list[str] = [
     "ToolExistsError",
     "ToolNotFoundError",
     "engine",
+    "get_session",
     "setup_database",
 ]
 
+import os
+from threading import Lock
 from typing import TYPE_CHECKING
 
+from rapidfuzz import fuzz, process
+from sqlalchemy import event, func, inspect, update
 from sqlalchemy.exc import IntegrityError, NoResultFound
-from sqlmodel import SQLModel, create_engine, select
-from thefuzz import fuzz  # type: ignore[import-untyped]
+from sqlalchemy.pool import QueuePool
+from sqlmodel import Session, SQLModel, col, create_engine, select
 
-from tool_inventory.models import Tool
+from tool_inventory.models import Tool, ToolList
 
 if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Callable, Generator, Sequence
     from uuid import UUID
 
-    from sqlmodel import Session
+    from sqlalchemy import Connection
+    from sqlalchemy.pool import ConnectionPoolEntry
 
 
 class ObjectNotFoundError(Exception):
     """Object not found error."""
 
-    def __init__(self, object_id: UUID, /) -> None:
+    def __init__(self, object_id: UUID | None = None, /) -> None:
         """Initialize object not found error.
 
         Args:
-            object_id: The UUID of the object.
+            object_id: The UUID of the object, if known.
         """
         self.object_id = object_id
         self.detail = "Object not found"
@@ -48,11 +56,11 @@ class ObjectNotFoundError(Exception):
 class ToolNotFoundError(ObjectNotFoundError):
     """Tool not found error."""
 
-    def __init__(self, tool_id: UUID, /) -> None:
+    def __init__(self, tool_id: UUID | None = None, /) -> None:
         """Initialize tool not found error.
 
         Args:
-            tool_id: The UUID of the tool.
+            tool_id: The UUID of the tool, if known.
         """
         super().__init__(tool_id)
         self.detail = "Tool not found"
@@ -61,11 +69,11 @@ class ToolNotFoundError(ObjectNotFoundError):
 class ObjectExistsError(Exception):
     """Object exists error."""
 
-    def __init__(self, object_id: UUID, /) -> None:
+    def __init__(self, object_id: UUID | None = None, /) -> None:
         """Initialize object exists error.
 
         Args:
-            object_id: The UUID of the object.
+            object_id: The UUID of the object, if known.
         """
         self.object_id = object_id
         self.detail = "Object already exists"
@@ -74,16 +82,61 @@ class ObjectExistsError(Exception):
 class ToolExistsError(ObjectExistsError):
     """Tool exists error."""
 
-    def __init__(self, tool_id: UUID, /) -> None:
+    def __init__(self, tool_id: UUID | None = None, /) -> None:
         """Initialize tool exists error.
 
         Args:
-            tool_id: The UUID of the tool.
+            tool_id: The UUID of the tool, if known.
         """
         super().__init__(tool_id)
         self.detail = "Tool already exists"
 
 
+class _SearchCache:
+    """Lowercased tool names by ID, shared by searches and cleared on every write.
+
+    The cache is local to the process. With several workers, a write only clears the
+    cache of the worker that handled it, so other workers may rank stale names until
+    they handle a write themselves.
+    """
+
+    def __init__(self) -> None:
+        """Initialize search cache."""
+        self.generation = 0
+        self._names: dict[UUID, str] | None = None
+        self._lock = Lock()
+
+    def get(self) -> dict[UUID, str] | None:
+        """Get the cached names.
+
+        Returns:
+            The lowercased names by tool ID, or None if they are not cached.
+        """
+        with self._lock:
+            return self._names
+
+    def put(self, names: dict[UUID, str], generation: int, /) -> None:
+        """Cache the names.
+
+        Args:
+            names: The lowercased names by tool ID.
+            generation: The cache generation the names were loaded in. They are
+                dropped if a write cleared the cache since.
+        """
+        with self._lock:
+            if generation == self.generation:
+                self._names = names
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self.generation += 1
+            self._names = None
+
+
+_search_cache = _SearchCache()
+
+
 class Database:
     """Database connection."""
 
@@ -129,6 +182,19 @@ class Database:
         result = self.session.exec(statement)
         return list(result.all())
 
+    def list_tools(self) -> list[ToolList]:
+        """List tools with only the columns needed to display them.
+
+        Returns:
+            A list of tool listings.
+        """
+        statement = select(Tool.id, Tool.name, Tool.description, Tool.quantity)
+        result = self.session.exec(statement)
+        return [
+            ToolList(id=tool_id, name=name, description=description, quantity=quantity)
+            for tool_id, name, description, quantity in result
+        ]
+
     def search_tools(self, query: str, /) -> list[Tool]:
         """Search tools.
 
@@ -138,13 +204,34 @@ class Database:
         Returns:
             A list of tools.
         """
-        statement = select(Tool)
-        result = self.session.exec(statement)
-        matches: list[tuple[int, Tool]] = []
-        for tool in result.all():
-            if (score := fuzz.ratio(query.lower(), tool.name.lower())) > 50:  # noqa: PLR2004
-                matches.append((score, tool))  # noqa: PERF401
-        return [tool for _, tool in sorted(matches, reverse=True)]
+        names = _search_cache.get()
+        if names is None:
+            generation = _search_cache.generation
+            names = self._load_search_names()
+            _search_cache.put(names, generation)
+        matches = process.extract(
+            query.lower(),
+            names,
+            scorer=fuzz.ratio,
+            score_cutoff=50,
+            limit=None,
+        )
+        if not matches:
+            return []
+        statement = select(Tool).where(
+            col(Tool.id).in_([tool_id for _, _, tool_id in matches]),
+        )
+        tools = {tool.id: tool for tool in self.session.exec(statement)}
+        return [tools[tool_id] for _, _, tool_id in matches if tool_id in tools]
+
+    def _load_search_names(self) -> dict[UUID, str]:
+        """Load the lowercased names of every tool.
+
+        Returns:
+            The lowercased names, by tool ID.
+        """
+        statement = select(Tool.id, Tool.name_lower)
+        return dict(self.session.exec(statement).all())
 
     def create_tool(self, tool: Tool, /) -> Tool:
         """Create a tool.
@@ -158,14 +245,7 @@ class Database:
         Raises:
             ToolExistsError: If the tool already exists.
         """
-        Tool.model_validate(tool)
-        self.session.add(tool)
-        try:
-            self.session.commit()
-        except IntegrityError as err:
-            raise ToolExistsError(tool.id) from err
-        self.session.refresh(tool)
-        return tool
+        return self._commit_tools([tool], ToolExistsError)[0]
 
     def update_tool(self, tool: Tool, /) -> Tool:
         """Update a tool.
@@ -179,14 +259,62 @@ class Database:
         Raises:
             ToolNotFoundError: If the tool is not found.
         """
-        Tool.model_validate(tool)
-        self.session.add(tool)
-        try:
-            self.session.commit()
-        except IntegrityError as err:
-            raise ToolNotFoundError(tool.id) from err
-        self.session.refresh(tool)
-        return tool
+        return self._commit_tools([tool], ToolNotFoundError)[0]
+
+    def update_tool_quantity(self, tool_id: UUID, delta: int, /) -> int:
+        """Change the quantity of a tool, without going below zero.
+
+        Args:
+            tool_id: The UUID of the tool.
+            delta: The amount to add to the quantity.
+
+        Returns:
+            The new quantity of the tool.
+
+        Raises:
+            ToolNotFoundError: If the tool is not found.
+        """
+        statement = (
+            update(Tool)
+            .where(col(Tool.id) == tool_id)
+            .values(quantity=func.max(0, col(Tool.quantity) + delta))
+            .returning(col(Tool.quantity))
+        )
+        quantity: int | None = self.session.execute(statement).scalar_one_or_none()
+        if quantity is None:
+            raise ToolNotFoundError(tool_id)
+        self.session.commit()
+        return quantity
+
+    def bulk_create_tools(self, tools: Sequence[Tool], /) -> list[Tool]:
+        """Create several tools in a single transaction.
+
+        Args:
+            tools: The tools to create.
+
+        Returns:
+            The created tools.
+
+        Raises:
+            ToolExistsError: If any of the tools already exists. The error does not
+                name a tool, since the database does not report which one failed.
+        """
+        return self._commit_tools(tools, ToolExistsError)
+
+    def bulk_update_tools(self, tools: Sequence[Tool], /) -> list[Tool]:
+        """Update several tools in a single transaction.
+
+        Args:
+            tools: The tools to update.
+
+        Returns:
+            The updated tools.
+
+        Raises:
+            ToolNotFoundError: If any of the tools is not found. The error does not
+                name a tool, since the database does not report which one failed.
+        """
+        return self._commit_tools(tools, ToolNotFoundError)
 
     def delete_tool(self, tool_id: UUID, /) -> None:
         """Delete a tool.
@@ -200,15 +328,114 @@ class Database:
         tool = self.get_tool_by_id(tool_id)
         self.session.delete(tool)
         self.session.commit()
+        _search_cache.clear()
 
+    def _commit_tools(
+        self,
+        tools: Sequence[Tool],
+        error: Callable[[UUID | None], Exception],
+        /,
+    ) -> list[Tool]:
+        """Add tools to the session and commit them in a single transaction.
 
-engine = create_engine("sqlite:///tools.db", echo=True)
+        Args:
+            tools: The tools to add.
+            error: The error to raise if the commit violates a constraint. It
+                receives the ID of the tool when there is only one, and None
+                otherwise, since the database does not report which row failed.
+
+        Returns:
+            The committed tools.
+        """
+        self.session.add_all(tools)
+        try:
+            self.session.commit()
+        except IntegrityError as err:
+            raise error(tools[0].id if len(tools) == 1 else None) from err
+        _search_cache.clear()
+        return list(tools)
+
+
+engine = create_engine(
+    "sqlite:///tools.db",
+    echo=os.getenv("TOOL_INV_SQL_ECHO") == "1",
+    connect_args={"check_same_thread": False},
+    poolclass=QueuePool,
+    pool_size=10,
+    max_overflow=20,
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(
+    dbapi_connection: sqlite3.Connection,
+    _connection_record: ConnectionPoolEntry,
+) -> None:
+    """Tune SQLite on every new connection.
+
+    Args:
+        dbapi_connection: The raw SQLite connection.
+        _connection_record: The pool's connection record.
+    """
+    for pragma in (
+        "journal_mode=WAL",
+        "synchronous=NORMAL",
+        "busy_timeout=5000",
+        "cache_size=-64000",
+        "temp_store=MEMORY",
+    ):
+        dbapi_connection.execute(f"PRAGMA {pragma}")
+
+
+_FTS_DROPS: list[str] = [
+    "DROP TRIGGER IF EXISTS tool_fts_insert",
+    "DROP TRIGGER IF EXISTS tool_fts_delete",
+    "DROP TRIGGER IF EXISTS tool_fts_update",
+    "DROP TABLE IF EXISTS tool_fts",
+]
+"""Statements removing the FTS5 name index older versions kept in sync."""
+
+
+def get_session() -> Generator[Session]:
+    """Get a database session.
+
+    Yields:
+        A session bound to the shared engine.
+    """
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+def _add_name_lower_column(connection: Connection, /) -> None:
+    """Add the lowercased name column to a tool table created before it existed.
+
+    This is a one-off migration: it does nothing once the column exists, which is
+    always the case for databases created by the current models. The added column
+    matches the one the models declare, a non-null string with an empty server
+    default, and existing rows are backfilled with Python's `str.lower`, like the
+    mapper does on every write.
+
+    Args:
+        connection: The connection to migrate the database with.
+    """
+    columns = {column["name"] for column in inspect(connection).get_columns("tool")}
+    if "name_lower" in columns:
+        return
+    connection.exec_driver_sql(
+        "ALTER TABLE tool ADD COLUMN name_lower VARCHAR NOT NULL DEFAULT ''",
+    )
+    tools = connection.exec_driver_sql("SELECT id, name FROM tool").all()
+    if tools:
+        connection.exec_driver_sql(
+            "UPDATE tool SET name_lower = ? WHERE id = ?",
+            [(name.lower(), tool_id) for tool_id, name in tools],
+        )
 
 
 def setup_database() -> None:
     """Setup database."""
     SQLModel.metadata.create_all(engine)
-
-
-# Remove this later
-setup_database()
+    with engine.begin() as connection:
+        _add_name_lower_column(connection)
+        for statement in _FTS_DROPS:
+            connection.exec_driver_sql(statement)
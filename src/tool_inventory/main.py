@@ -13,13 +13,18 @@ from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
 from fastapi import FastAPI, Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from loguru import logger
 from pydantic import ValidationError
 
 from tool_inventory import root
-from tool_inventory.connections import ObjectExistsError, ObjectNotFoundError
+from tool_inventory.connections import (
+    ObjectExistsError,
+    ObjectNotFoundError,
+    setup_database,
+)
 from tool_inventory.routers import tools, webapp
 
 if TYPE_CHECKING:
@@ -38,6 +43,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     """
     logger.remove()
     logger.add(sys.stderr, level="DEBUG")
+    setup_database()
     yield
 
 
@@ -62,7 +68,7 @@ async def object_not_found_error_handler(
     """
     return JSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
-        content={"detail": exc.detail, "object_id": exc.object_id},
+        content=jsonable_encoder({"detail": exc.detail, "object_id": exc.object_id}),
     )
 
 
@@ -82,7 +88,7 @@ async def object_exists_error_handler(
     """
     return JSONResponse(
         status_code=status.HTTP_409_CONFLICT,
-        content={"detail": exc.detail, "object_id": exc.object_id},
+        content=jsonable_encoder({"detail": exc.detail, "object_id": exc.object_id}),
     )
 
 
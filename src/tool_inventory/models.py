@@ -9,15 +9,22 @@ from __future__ import annotations
 __all__: list[str] = [
     "Tool",
     "ToolCreate",
+    "ToolList",
     "ToolPatch",
 ]
 
+from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel
 from pydantic import Field as PydanticField
+from sqlalchemy import event
 from sqlmodel import Field, SQLModel
 
+if TYPE_CHECKING:
+    from sqlalchemy import Connection
+    from sqlalchemy.orm import Mapper
+
 
 class ToolCreate(BaseModel):
     """Tool creation model."""
@@ -48,16 +55,48 @@ class Tool(SQLModel, table=True):
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     name: str = Field(index=True, nullable=False, min_length=1)
+    name_lower: str = Field(
+        default="",
+        nullable=False,
+        exclude=True,
+        sa_column_kwargs={"server_default": ""},
+    )
     quantity: int = Field(default=0, ge=0)
     description: str = ""
     image: str = ""
 
 
+@event.listens_for(Tool, "before_insert")
+@event.listens_for(Tool, "before_update")
+def _set_name_lower(
+    _mapper: Mapper[Tool],
+    _connection: Connection,
+    target: Tool,
+) -> None:
+    """Keep the lowercased name of a tool in sync with its name.
+
+    Args:
+        _mapper: The tool mapper.
+        _connection: The connection the tool is written with.
+        target: The tool being written.
+    """
+    target.name_lower = target.name.lower()
+
+
+class ToolList(BaseModel):
+    """Tool listing model."""
+
+    id: UUID
+    name: str
+    description: str
+    quantity: int
+
+
 class ToolPatch(BaseModel):
     """Tool patch model."""
 
-    name: str | None = None
-    quantity: int | None = None
+    name: str | None = PydanticField(default=None, min_length=1)
+    quantity: int | None = PydanticField(default=None, ge=0)
     description: str | None = None
     image: str | None = None
 
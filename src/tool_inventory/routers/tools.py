@@ -8,12 +8,13 @@ from __future__ import annotations
 
 __all__: list[str] = ["router"]
 
+from typing import Annotated
 from uuid import UUID  # noqa: TC003
 
-from fastapi import APIRouter, status
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, status
+from sqlmodel import Session  # noqa: TC002
 
-from tool_inventory.connections import Database, engine
+from tool_inventory.connections import Database, get_session
 from tool_inventory.models import Tool, ToolCreate, ToolPatch  # noqa: TC001
 
 router = APIRouter(prefix="/api/tool")
@@ -24,81 +25,131 @@ router = APIRouter(prefix="/api/tool")
     status_code=status.HTTP_201_CREATED,
     summary="Create a tool",
 )
-async def create_tool(
+def create_tool(
     tool: ToolCreate,
+    session: Annotated[Session, Depends(get_session)],
 ) -> Tool:
     """Create a new tool.
 
     Args:
         tool: The tool creation model.
+        session: The database session.
 
     Returns:
         The created tool.
     """
-    with Session(engine) as session:
-        db = Database(session)
-        return db.create_tool(tool.to_model())
+    db = Database(session)
+    return db.create_tool(tool.to_model())
+
+
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    summary="Create several tools",
+)
+def bulk_create_tools(
+    tools: list[ToolCreate],
+    session: Annotated[Session, Depends(get_session)],
+) -> list[Tool]:
+    """Create several new tools at once.
+
+    Args:
+        tools: The tool creation models.
+        session: The database session.
+
+    Returns:
+        The created tools.
+    """
+    db = Database(session)
+    return db.bulk_create_tools([tool.to_model() for tool in tools])
+
+
+@router.patch(
+    "/bulk",
+    summary="Update several tools",
+)
+def bulk_update_tools(
+    tool_patches: dict[UUID, ToolPatch],
+    session: Annotated[Session, Depends(get_session)],
+) -> list[Tool]:
+    """Update several existing tools at once.
+
+    Args:
+        tool_patches: The tool patch models, keyed by the UUID of the tool to update.
+        session: The database session.
+
+    Returns:
+        The updated tools.
+    """
+    db = Database(session)
+    tools = [db.get_tool_by_id(tool_id) for tool_id in tool_patches]
+    return db.bulk_update_tools(
+        [tool_patches[tool.id].patch(tool) for tool in tools],
+    )
 
 
 @router.get(
     "/{tool_id}",
     summary="Get a tool by ID",
 )
-async def get_tool_by_id(
+def get_tool_by_id(
     tool_id: UUID,
+    session: Annotated[Session, Depends(get_session)],
 ) -> Tool:
     """Get a tool by its ID.
 
     Args:
         tool_id: The UUID of the tool.
+        session: The database session.
 
     Returns:
         The tool with the specified ID.
     """
-    with Session(engine) as session:
-        db = Database(session)
-        return db.get_tool_by_id(tool_id)
+    db = Database(session)
+    return db.get_tool_by_id(tool_id)
 
 
 @router.get(
     "/",
     summary="Get tools",
 )
-async def get_tools(
+def get_tools(
+    session: Annotated[Session, Depends(get_session)],
     name: str | None = None,
 ) -> list[Tool]:
     """Get tools by name.
 
     Args:
+        session: The database session.
         name: The name of the tool to filter by.
 
     Returns:
         A list of tools.
     """
-    with Session(engine) as session:
-        db = Database(session)
-        return db.get_tools(name=name)
+    db = Database(session)
+    return db.get_tools(name=name)
 
 
 @router.patch(
     "/{tool_id}",
     summary="Update a tool",
 )
-async def update_tool(
+def update_tool(
     tool_id: UUID,
     tool_patch: ToolPatch,
+    session: Annotated[Session, Depends(get_session)],
 ) -> Tool:
     """Update an existing tool.
 
     Args:
         tool_id: The UUID of the tool to update.
         tool_patch: The tool patch model.
+        session: The database session.
 
     Returns:
         The updated tool.
     """
-    with Session(engine) as session:
-        db = Database(session)
-        tool = db.get_tool_by_id(tool_id)
-        tool_patch.patch(tool)
-        return db.update_tool(tool)
+    db = Database(session)
+    tool = db.get_tool_by_id(tool_id)
+    tool_patch.patch(tool)
+    return db.update_tool(tool)
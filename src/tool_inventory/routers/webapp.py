@@ -9,41 +9,46 @@ from __future__ import annotations
 
 __all__: list[str] = ["router"]
 
+import os
 from typing import Annotated
 from uuid import UUID  # noqa: TC003
 
-from fastapi import APIRouter, Form, Request, status
+from fastapi import APIRouter, Depends, Form, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
-from sqlmodel import Session
+from jinja2 import FileSystemBytecodeCache
+from sqlmodel import Session  # noqa: TC002
 
 from tool_inventory import root
-from tool_inventory.connections import Database, engine
+from tool_inventory.connections import Database, get_session
 from tool_inventory.models import ToolCreate, ToolPatch
 
 router = APIRouter()
 templates = Jinja2Templates(directory=root / "templates")
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+templates.env.auto_reload = os.getenv("TOOL_INV_TEMPLATE_RELOAD") == "1"
 
 
 @router.get("/")
-async def web_read_tools(
+def web_read_tools(
     request: Request,
+    session: Annotated[Session, Depends(get_session)],
 ) -> HTMLResponse:
     """Fetch and display all tools.
 
     Args:
         request: The request object.
+        session: The database session.
 
     Returns:
         An HTML response with the list of tools.
     """
-    with Session(engine) as session:
-        db = Database(session)
-        tools = db.get_tools()
-        return templates.TemplateResponse(
-            "index.html",
-            {"request": request, "tools": tools},
-        )
+    db = Database(session)
+    tools = db.list_tools()
+    return templates.TemplateResponse(
+        "index.html",
+        {"request": request, "tools": tools},
+    )
 
 
 @router.get("/create")
@@ -65,10 +70,11 @@ async def web_create_tool_form(
 
 
 @router.post("/create")
-async def web_create_tool(
+def web_create_tool(
     name: Annotated[str, Form()],
     description: Annotated[str, Form()],
     quantity: Annotated[int, Form()],
+    session: Annotated[Session, Depends(get_session)],
 ) -> RedirectResponse:
     """Create a new tool.
 
@@ -76,50 +82,52 @@ async def web_create_tool(
         name: The name of the tool.
         description: The description of the tool.
         quantity: The quantity of the tool.
+        session: The database session.
 
     Returns:
         A redirect response to the home page.
     """
-    with Session(engine) as session:
-        db = Database(session)
-        db.create_tool(
-            ToolCreate(
-                name=name,
-                description=description,
-                quantity=quantity,
-            ).to_model(),
-        )
+    db = Database(session)
+    db.create_tool(
+        ToolCreate(
+            name=name,
+            description=description,
+            quantity=quantity,
+        ).to_model(),
+    )
     return RedirectResponse("/", status_code=status.HTTP_303_SEE_OTHER)
 
 
 @router.get("/edit/{tool_id}")
-async def web_edit_tool_form(
+def web_edit_tool_form(
     request: Request,
     tool_id: UUID,
+    session: Annotated[Session, Depends(get_session)],
 ) -> HTMLResponse:
     """Render the tool edit form.
 
     Args:
         request: The request object.
         tool_id: The UUID of the tool to edit.
+        session: The database session.
 
     Returns:
         An HTML response with the tool edit form.
     """
-    with Session(engine) as session:
-        db = Database(session)
-        return templates.TemplateResponse(
-            "tool_form.html",
-            {"request": request, "tool": db.get_tool_by_id(tool_id)},
-        )
+    db = Database(session)
+    return templates.TemplateResponse(
+        "tool_form.html",
+        {"request": request, "tool": db.get_tool_by_id(tool_id)},
+    )
 
 
 @router.post("/edit/{tool_id}")
-async def web_edit_tool(
+def web_edit_tool(
     tool_id: UUID,
     name: Annotated[str, Form()],
     description: Annotated[str, Form()],
     quantity: Annotated[int, Form()],
+    session: Annotated[Session, Depends(get_session)],
 ) -> RedirectResponse:
     """Edit an existing tool.
 
@@ -128,39 +136,40 @@ async def web_edit_tool(
         name: The new name of the tool.
         description: The new description of the tool.
         quantity: The new quantity of the tool.
+        session: The database session.
 
     Returns:
         A redirect response to the home page.
     """
-    with Session(engine) as session:
-        db = Database(session)
-        db.update_tool(
-            ToolPatch(
-                name=name,
-                description=description,
-                quantity=quantity,
-            ).patch(db.get_tool_by_id(tool_id)),
-        )
+    db = Database(session)
+    db.update_tool(
+        ToolPatch(
+            name=name,
+            description=description,
+            quantity=quantity,
+        ).patch(db.get_tool_by_id(tool_id)),
+    )
     return RedirectResponse("/", status_code=status.HTTP_303_SEE_OTHER)
 
 
 @router.post("/delete/{tool_id}")
-async def web_delete_tool(
+def web_delete_tool(
     request: Request,
     tool_id: UUID,
+    session: Annotated[Session, Depends(get_session)],
 ) -> HTMLResponse:
     """Delete a tool.
 
     Args:
         request: The request object.
         tool_id: The UUID of the tool to delete.
+        session: The database session.
 
     Returns:
         A script to delete the tool.
     """
-    with Session(engine) as session:
-        db = Database(session)
-        db.delete_tool(tool_id)
+    db = Database(session)
+    db.delete_tool(tool_id)
     return templates.TemplateResponse(
         "delete_tool.html",
         {"request": request, "tool_id": tool_id},
@@ -168,10 +177,11 @@ async def web_delete_tool(
 
 
 @router.post("/update_quantity/{tool_id}")
-async def web_update_quantity(
+def web_update_quantity(
     request: Request,
     tool_id: UUID,
     action: Annotated[str, Form()],
+    session: Annotated[Session, Depends(get_session)],
 ) -> HTMLResponse:
     """Update the quantity of a tool.
 
@@ -179,45 +189,41 @@ async def web_update_quantity(
         request: The request object.
         tool_id: The UUID of the tool to update.
         action: The action to perform (increment or decrement).
+        session: The database session.
 
     Returns:
         A script to update quantity.
     """
-    with Session(engine) as session:
-        db = Database(session)
-        tool = db.get_tool_by_id(tool_id)
-        db.update_tool(
-            ToolPatch(
-                quantity=max(
-                    0,
-                    tool.quantity + 1 if action == "increment" else tool.quantity - 1,
-                ),
-            ).patch(tool),
-        )
+    db = Database(session)
+    quantity = db.update_tool_quantity(
+        tool_id,
+        1 if action == "increment" else -1,
+    )
     return templates.TemplateResponse(
         "update_quantity.html",
-        {"request": request, "tool_id": tool.id, "quantity": tool.quantity},
+        {"request": request, "tool_id": tool_id, "quantity": quantity},
     )
 
 
 @router.get("/search")
-async def web_search_tools(
+def web_search_tools(
     request: Request,
     query: str,
+    session: Annotated[Session, Depends(get_session)],
 ) -> HTMLResponse:
     """Search for tools.
 
     Args:
         request: The request object.
         query: The search query.
+        session: The database session.
 
     Returns:
         An HTML response with the search results.
     """
-    with Session(engine) as session:
-        db = Database(session)
-        tools = db.search_tools(query)
-        return templates.TemplateResponse(
-            "index.html",
-            {"request": request, "query": query, "tools": tools},
-        )
+    db = Database(session)
+    tools = db.search_tools(query)
+    return templates.TemplateResponse(
+        "index.html",
+        {"request": request, "query": query, "tools": tools},
+    )
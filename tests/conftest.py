@@ -0,0 +1,44 @@
+"""Fixtures for tool-inventory tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, create_engine
+
+from tool_inventory import connections
+from tool_inventory.main import app
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from sqlalchemy import Engine
+
+
+@pytest.fixture
+def engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Engine:
+    """Point the application at a fresh database in a temporary directory."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'tools.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    monkeypatch.setattr(connections, "engine", engine)
+    connections.setup_database()
+    connections._search_cache.clear()  # noqa: SLF001
+    return engine
+
+
+@pytest.fixture
+def session(engine: Engine) -> Generator[Session]:
+    """Open a session on the test database."""
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def client(engine: Engine) -> TestClient:  # noqa: ARG001
+    """Create a client for the application, backed by the test database."""
+    return TestClient(app)
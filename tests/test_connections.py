@@ -0,0 +1,155 @@
+"""Tests for the database connection."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import pytest
+from sqlmodel import Session, create_engine, select
+
+from tool_inventory import connections
+from tool_inventory.connections import Database, ToolExistsError, ToolNotFoundError
+from tool_inventory.models import Tool, ToolCreate, ToolPatch
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_search_tools_follows_writes(session: Session) -> None:
+    """Search results reflect tools created, renamed and deleted since."""
+    db = Database(session)
+    hammer = db.create_tool(ToolCreate(name="Hammer", quantity=1).to_model())
+    assert db.search_tools("hammer") == [hammer]
+    assert db.search_tools("saw") == []
+
+    db.update_tool(ToolPatch(name="Saw").patch(hammer))
+    assert db.search_tools("hammer") == []
+    assert db.search_tools("saw") == [hammer]
+    assert db.search_tools("sa") == [hammer]
+
+    db.create_tool(ToolCreate(name="Hammer drill", quantity=1).to_model())
+    assert [tool.name for tool in db.search_tools("hammer")] == ["Hammer drill"]
+
+    db.delete_tool(hammer.id)
+    assert db.search_tools("saw") == []
+
+
+def test_search_tools_typos(session: Session) -> None:
+    """Misspelled queries still find tools that share no trigram with them."""
+    db = Database(session)
+    hammer = db.create_tool(ToolCreate(name="Hammer", quantity=1).to_model())
+    assert db.search_tools("hmaer") == [hammer]
+
+
+def test_setup_database_drops_fts_index(session: Session) -> None:
+    """The FTS5 name index and its triggers from older versions are removed."""
+    connection = session.connection()
+    connection.exec_driver_sql(
+        "CREATE VIRTUAL TABLE tool_fts USING fts5("
+        "id UNINDEXED, name, tokenize = 'trigram')",
+    )
+    connection.exec_driver_sql(
+        "CREATE TRIGGER tool_fts_insert AFTER INSERT ON tool BEGIN "
+        "INSERT INTO tool_fts (id, name) VALUES (new.id, new.name); END",
+    )
+    session.commit()
+
+    connections.setup_database()
+
+    objects = session.connection().exec_driver_sql(
+        "SELECT name FROM sqlite_master WHERE name LIKE 'tool_fts%'",
+    )
+    assert objects.all() == []
+    db = Database(session)
+    db.create_tool(ToolCreate(name="Hammer", quantity=1).to_model())
+
+
+def test_tool_name_lower(session: Session) -> None:
+    """The lowercased name follows the name however the tool is written."""
+    db = Database(session)
+    tool = db.create_tool(Tool(name="Hammer", quantity=1))
+    assert tool.name_lower == "hammer"
+    tool.name = "Ärmel"
+    db.update_tool(tool)
+    assert tool.name_lower == "ärmel"
+
+
+def test_setup_database_migrates_old_schema(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A database without the lowercased name column or FTS table is upgraded."""
+    path = tmp_path / "tools.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE tool ("
+            "id CHAR(32) NOT NULL, name VARCHAR NOT NULL, quantity INTEGER NOT NULL, "
+            "description VARCHAR NOT NULL, image VARCHAR NOT NULL, PRIMARY KEY (id))",
+        )
+        connection.execute(
+            "INSERT INTO tool VALUES "
+            "('0123456789abcdef0123456789abcdef', 'Pickaxe', 1, '', '')",
+        )
+    connection.close()
+    engine = create_engine(f"sqlite:///{path}")
+    monkeypatch.setattr(connections, "engine", engine)
+    connections._search_cache.clear()  # noqa: SLF001
+
+    connections.setup_database()
+    connections.setup_database()
+
+    with Session(engine) as session:
+        assert session.exec(select(Tool.name_lower)).all() == ["pickaxe"]
+        assert [tool.name for tool in Database(session).search_tools("axe")] == [
+            "Pickaxe",
+        ]
+    with sqlite3.connect(path) as connection:
+        name_lower = connection.execute(
+            "SELECT \"notnull\", dflt_value FROM pragma_table_info('tool') "
+            "WHERE name = 'name_lower'",
+        ).fetchone()
+    connection.close()
+    assert name_lower == (1, "''")
+
+
+def test_bulk_create_tools_is_atomic(session: Session) -> None:
+    """A constraint violation mid-batch commits none of the batch."""
+    db = Database(session)
+    hammer = db.create_tool(ToolCreate(name="Hammer", quantity=1).to_model())
+    session.expunge_all()
+
+    with pytest.raises(ToolExistsError) as exc_info:
+        db.bulk_create_tools(
+            [
+                ToolCreate(name="Saw", quantity=1).to_model(),
+                Tool(id=hammer.id, name="Hammer copy", quantity=1),
+            ],
+        )
+    assert exc_info.value.object_id is None
+    session.rollback()
+    assert [tool.name for tool in db.get_tools()] == ["Hammer"]
+
+    with pytest.raises(ToolExistsError) as exc_info:
+        db.create_tool(Tool(id=hammer.id, name="Hammer copy", quantity=1))
+    assert exc_info.value.object_id == hammer.id
+
+
+def test_update_tool_quantity_clamps_at_zero(session: Session) -> None:
+    """Quantities change by the delta but never go below zero."""
+    db = Database(session)
+    tool = db.create_tool(ToolCreate(name="Hammer", quantity=1).to_model())
+    assert db.update_tool_quantity(tool.id, 2) == 3  # noqa: PLR2004
+    assert db.update_tool_quantity(tool.id, -5) == 0
+    assert db.update_tool_quantity(tool.id, -1) == 0
+    assert db.get_tool_by_id(tool.id).quantity == 0
+
+
+def test_update_tool_quantity_not_found(session: Session) -> None:
+    """Changing the quantity of a missing tool raises an error."""
+    db = Database(session)
+    tool_id = uuid4()
+    with pytest.raises(ToolNotFoundError) as exc_info:
+        db.update_tool_quantity(tool_id, 1)
+    assert exc_info.value.object_id == tool_id
@@ -0,0 +1,88 @@
+"""Tests for the tools API router."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from fastapi import status
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+
+def test_create_tool_hides_name_lower(client: TestClient) -> None:
+    """The stored lowercased name is not part of the API."""
+    response = client.post("/api/tool/", json={"name": "Hammer", "quantity": 1})
+    assert response.status_code == status.HTTP_201_CREATED
+    assert "name_lower" not in response.json()
+    schema = client.get("/openapi.json").json()["components"]["schemas"]["Tool"]
+    assert "name_lower" not in schema["properties"]
+
+
+def test_bulk_create_tools(client: TestClient) -> None:
+    """Create several tools in one request."""
+    response = client.post(
+        "/api/tool/bulk",
+        json=[{"name": "Hammer", "quantity": 1}, {"name": "Saw", "quantity": 2}],
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [tool["name"] for tool in response.json()] == ["Hammer", "Saw"]
+    names = {tool["name"] for tool in client.get("/api/tool/").json()}
+    assert names == {"Hammer", "Saw"}
+
+
+def test_bulk_create_tools_invalid(client: TestClient) -> None:
+    """Reject a batch with an invalid tool before writing anything."""
+    response = client.post(
+        "/api/tool/bulk",
+        json=[{"name": "Hammer", "quantity": 1}, {"name": "Saw", "quantity": -1}],
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert client.get("/api/tool/").json() == []
+
+
+def test_bulk_update_tools(client: TestClient) -> None:
+    """Update several tools in one request."""
+    hammer, saw = client.post(
+        "/api/tool/bulk",
+        json=[{"name": "Hammer", "quantity": 1}, {"name": "Saw", "quantity": 2}],
+    ).json()
+    response = client.patch(
+        "/api/tool/bulk",
+        json={hammer["id"]: {"quantity": 5}, saw["id"]: {"name": "Jigsaw"}},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    tools = {tool["id"]: tool for tool in client.get("/api/tool/").json()}
+    assert tools[hammer["id"]]["quantity"] == 5  # noqa: PLR2004
+    assert tools[saw["id"]]["name"] == "Jigsaw"
+
+
+def test_bulk_update_tools_invalid(client: TestClient) -> None:
+    """Reject a batch with an invalid patch before writing anything."""
+    hammer, saw = client.post(
+        "/api/tool/bulk",
+        json=[{"name": "Hammer", "quantity": 1}, {"name": "Saw", "quantity": 2}],
+    ).json()
+    response = client.patch(
+        "/api/tool/bulk",
+        json={hammer["id"]: {"quantity": 5}, saw["id"]: {"quantity": -1}},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    quantities = {
+        tool["id"]: tool["quantity"] for tool in client.get("/api/tool/").json()
+    }
+    assert quantities == {hammer["id"]: 1, saw["id"]: 2}
+
+
+def test_bulk_update_tools_not_found(client: TestClient) -> None:
+    """Leave every tool unchanged if a later tool in the batch does not exist."""
+    hammer = client.post("/api/tool/", json={"name": "Hammer", "quantity": 1}).json()
+    missing_id = str(uuid4())
+    response = client.patch(
+        "/api/tool/bulk",
+        json={hammer["id"]: {"quantity": 5}, missing_id: {"quantity": 2}},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {"detail": "Tool not found", "object_id": missing_id}
+    assert client.get(f"/api/tool/{hammer['id']}").json()["quantity"] == 1
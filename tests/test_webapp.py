@@ -0,0 +1,26 @@
+"""Tests for the webapp router."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from fastapi import status
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+
+def test_web_update_quantity(client: TestClient) -> None:
+    """Increment and decrement a tool's quantity, stopping at zero."""
+    tool = client.post("/api/tool/", json={"name": "Hammer", "quantity": 1}).json()
+    url = f"/update_quantity/{tool['id']}"
+    for action, quantity in [
+        ("increment", 2),
+        ("decrement", 1),
+        ("decrement", 0),
+        ("decrement", 0),
+    ]:
+        response = client.post(url, data={"action": action})
+        assert response.status_code == status.HTTP_200_OK
+        assert f"innerText = '{quantity}'" in response.text
+    assert client.get(f"/api/tool/{tool['id']}").json()["quantity"] == 0